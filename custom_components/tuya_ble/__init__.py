@@ -1,6 +1,7 @@
 """The Tuya BLE integration."""
 from __future__ import annotations
 
+from collections import ChainMap
 import logging
 
 from bleak_retry_connector import BLEAK_RETRY_EXCEPTIONS as BLEAK_EXCEPTIONS, get_device
@@ -14,7 +15,7 @@ from homeassistant.exceptions import ConfigEntryNotReady
 
 from .tuya_ble import TuyaBLEDevice
 
-from .cloud import HASSTuyaBLEDeviceManager
+from .cloud import HASSTuyaBLEDeviceManager, _get_cache_key
 from .const import DOMAIN
 from .devices import TuyaBLECoordinator, TuyaBLEData, get_device_product_info
 
@@ -49,7 +50,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         )
     _LOGGER.debug("BLE device found: %s", ble_device)
 
-    manager = HASSTuyaBLEDeviceManager(hass, entry.options.copy())
+    manager = HASSTuyaBLEDeviceManager(hass, ChainMap({}, entry.options))
     _LOGGER.debug("Device manager initialized: %s", manager)
 
     device = TuyaBLEDevice(manager, ble_device)
@@ -94,6 +95,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         product_info,
         manager,
         coordinator,
+        _get_cache_key(entry.options),
     )
     _LOGGER.debug("TuyaBLEData stored in hass.data")
 
@@ -120,9 +122,15 @@ async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> Non
     """Handle options update."""
     _LOGGER.debug("Update listener triggered for entry: %s", entry.entry_id)
     data: TuyaBLEData = hass.data[DOMAIN][entry.entry_id]
-    if entry.title != data.title:
-        _LOGGER.debug("Entry title changed from %s to %s, reloading entry", data.title, entry.title)
+    if _get_cache_key(entry.options) != data.login_key:
+        _LOGGER.debug("Entry login changed, reloading entry")
         await hass.config_entries.async_reload(entry.entry_id)
+    else:
+        # Home Assistant replaces entry.options on update, rebind the view
+        data.manager.data.maps[-1] = entry.options
+        if entry.title != data.title:
+            _LOGGER.debug("Entry title changed from %s to %s", data.title, entry.title)
+            data.title = entry.title
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 import base64
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 import json
 import struct
 from typing import Any, Literal, Self, overload
@@ -23,7 +24,7 @@ from .util import remap_value
 _LOGGER = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class IntegerTypeData:
     """Integer Type Data."""
 
@@ -34,8 +35,10 @@ class IntegerTypeData:
     step: float
     unit: str | None = None
     type: str | None = None
+    _scale_factor: float = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
+        object.__setattr__(self, "_scale_factor", 10**self.scale)
         _LOGGER.debug(
             "Initialized IntegerTypeData with dpcode: %s, min: %d, max: %d, scale: %f, step: %f, unit: %s, type: %s",
             self.dpcode, self.min, self.max, self.scale, self.step, self.unit, self.type
@@ -45,33 +48,40 @@ class IntegerTypeData:
     def max_scaled(self) -> float:
         """Return the max scaled."""
         max_scaled_value = self.scale_value(self.max)
-        _LOGGER.debug("Max scaled value: %f", max_scaled_value)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Max scaled value: %f", max_scaled_value)
         return max_scaled_value
 
     @property
     def min_scaled(self) -> float:
         """Return the min scaled."""
         min_scaled_value = self.scale_value(self.min)
-        _LOGGER.debug("Min scaled value: %f", min_scaled_value)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Min scaled value: %f", min_scaled_value)
         return min_scaled_value
 
     @property
     def step_scaled(self) -> float:
         """Return the step scaled."""
-        step_scaled_value = self.step / (10**self.scale)
-        _LOGGER.debug("Step scaled value: %f", step_scaled_value)
+        step_scaled_value = self.step / self._scale_factor
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Step scaled value: %f", step_scaled_value)
         return step_scaled_value
 
     def scale_value(self, value: float | int) -> float:
         """Scale a value."""
-        scaled_value = value / (10**self.scale)
-        _LOGGER.debug("Scaled value: %f from original value: %s", scaled_value, value)
+        scaled_value = value / self._scale_factor
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Scaled value: %f from original value: %s", scaled_value, value
+            )
         return scaled_value
 
     def scale_value_back(self, value: float | int) -> int:
         """Return raw value for scaled."""
-        raw_value = int(value * (10**self.scale))
-        _LOGGER.debug("Raw value: %d from scaled value: %s", raw_value, value)
+        raw_value = int(value * self._scale_factor)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Raw value: %d from scaled value: %s", raw_value, value)
         return raw_value
 
     def remap_value_to(
@@ -83,10 +93,11 @@ class IntegerTypeData:
     ) -> float:
         """Remap a value from this range to a new range."""
         remapped_value = remap_value(value, self.min, self.max, to_min, to_max, reverse)
-        _LOGGER.debug(
-            "Remapped value: %f from original value: %f with range (%d, %d) to range (%d, %d), reverse: %s",
-            remapped_value, value, self.min, self.max, to_min, to_max, reverse
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Remapped value: %f from original value: %f with range (%d, %d) to range (%d, %d), reverse: %s",
+                remapped_value, value, self.min, self.max, to_min, to_max, reverse
+            )
         return remapped_value
 
     def remap_value_from(
@@ -98,10 +109,11 @@ class IntegerTypeData:
     ) -> float:
         """Remap a value from its current range to this range."""
         remapped_value = remap_value(value, from_min, from_max, self.min, self.max, reverse)
-        _LOGGER.debug(
-            "Remapped value: %f from original value: %f with range (%d, %d) to range (%d, %d), reverse: %s",
-            remapped_value, value, from_min, from_max, self.min, self.max, reverse
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Remapped value: %f from original value: %f with range (%d, %d) to range (%d, %d), reverse: %s",
+                remapped_value, value, from_min, from_max, self.min, self.max, reverse
+            )
         return remapped_value
 
     @classmethod
@@ -117,14 +129,15 @@ class IntegerTypeData:
             _LOGGER.warning("Parsed data is None")
             return None
 
-        instance = cls(
+        instance = _cached_integer_type_data(
+            cls,
             dpcode,
-            min=int(parsed["min"]),
-            max=int(parsed["max"]),
-            scale=float(parsed["scale"]),
-            step=max(float(parsed["step"]), 1),
-            unit=parsed.get("unit"),
-            type=parsed.get("type"),
+            int(parsed["min"]),
+            int(parsed["max"]),
+            float(parsed["scale"]),
+            max(float(parsed["step"]), 1),
+            parsed.get("unit"),
+            parsed.get("type"),
         )
         _LOGGER.debug("Created IntegerTypeData from JSON: %s", instance)
         return instance
@@ -137,18 +150,35 @@ class IntegerTypeData:
             _LOGGER.warning("Data is None or empty")
             return None
 
-        instance = cls(
+        instance = _cached_integer_type_data(
+            cls,
             dpcode,
-            min=int(data.get("min", 0)),
-            max=int(data.get("max", 0)),
-            scale=float(data.get("scale", 0)),
-            step=max(float(data.get("step", 0)), 1),
-            unit=data.get("unit"),
-            type=data.get("type"),
+            int(data.get("min", 0)),
+            int(data.get("max", 0)),
+            float(data.get("scale", 0)),
+            max(float(data.get("step", 0)), 1),
+            data.get("unit"),
+            data.get("type"),
         )
         _LOGGER.debug("Created IntegerTypeData from dict: %s", instance)
         return instance
 
+
+@lru_cache(maxsize=512)
+def _cached_integer_type_data(
+    cls: type[IntegerTypeData],
+    dpcode: DPCode,
+    min: int,
+    max: int,
+    scale: float,
+    step: float,
+    unit: str | None,
+    type: str | None,
+) -> IntegerTypeData:
+    """Return a shared IntegerTypeData instance for the given fields."""
+    return cls(dpcode, min, max, scale, step, unit, type)
+
+
 @dataclass
 class EnumTypeData:
     """Enum Type Data."""
@@ -1,11 +1,12 @@
 """The Tuya BLE integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 
-from dataclasses import dataclass
-import json
-from typing import Any, Iterable
+from dataclasses import dataclass, field
+from typing import Any, MutableMapping
 
 from homeassistant.const import (
     CONF_ADDRESS, 
@@ -52,9 +53,13 @@ from .const import (
     CONF_FUNCTIONS,
     CONF_STATUS_RANGE,
     DOMAIN,
+    CLOUD_CACHE,
+    CREDENTIALS_CACHE,
     TUYA_API_DEVICES_URL,
     TUYA_API_FACTORY_INFO_URL,
     TUYA_API_DEVICE_SPECIFICATION,
+    TUYA_API_MAX_PARALLEL_REQUESTS,
+    TUYA_API_TOKEN_MIN_LIFETIME,
     TUYA_FACTORY_INFO_MAC,
     TUYA_RESPONSE_RESULT,
     TUYA_RESPONSE_SUCCESS,
@@ -68,9 +73,18 @@ class TuyaCloudCacheItem:
     api: TuyaOpenAPI | None
     login: dict[str, Any]
     credentials: dict[str, dict[str, Any]]
-
-
-CONF_TUYA_LOGIN_KEYS = [
+    credential_objects: dict[str, TuyaBLEDeviceCredentials] = field(
+        default_factory=dict
+    )
+    # Caps the requests in flight on this login's API and shared session
+    semaphore: asyncio.Semaphore = field(
+        default_factory=lambda: asyncio.Semaphore(TUYA_API_MAX_PARALLEL_REQUESTS),
+        repr=False,
+        compare=False,
+    )
+
+
+CONF_TUYA_LOGIN_KEYS = (
     CONF_ENDPOINT,
     CONF_ACCESS_ID,
     CONF_ACCESS_SECRET,
@@ -79,9 +93,9 @@ CONF_TUYA_LOGIN_KEYS = [
     CONF_PASSWORD,
     CONF_COUNTRY_CODE,
     CONF_APP_TYPE,
-]
+)
 
-CONF_TUYA_DEVICE_KEYS = [
+CONF_TUYA_DEVICE_KEYS = (
     CONF_UUID,
     CONF_LOCAL_KEY,
     CONF_DEVICE_ID,
@@ -90,48 +104,66 @@ CONF_TUYA_DEVICE_KEYS = [
     CONF_DEVICE_NAME,
     CONF_PRODUCT_NAME,
     CONF_PRODUCT_MODEL,
-]
+)
 
-_cache: dict[str, TuyaCloudCacheItem] = {}
+# Argument order of TuyaBLEDeviceCredentials
+_CRED_KEYS = (
+    CONF_UUID,
+    CONF_LOCAL_KEY,
+    CONF_DEVICE_ID,
+    CONF_CATEGORY,
+    CONF_PRODUCT_ID,
+    CONF_DEVICE_NAME,
+    CONF_PRODUCT_MODEL,
+    CONF_PRODUCT_NAME,
+)
+_CRED_LIST_KEYS = (
+    CONF_FUNCTIONS,
+    CONF_STATUS_RANGE,
+)
+
+
+def _get_cache_key(data: dict[str, Any]) -> tuple:
+    return tuple(data.get(key) for key in CONF_TUYA_LOGIN_KEYS)
+
+
+def _has_login(data: dict[Any, Any]) -> bool:
+    has_login = None not in map(data.get, CONF_TUYA_LOGIN_KEYS)
+    _LOGGER.debug("Has login: %s", has_login)
+    return has_login
+
+
+def _has_credentials(data: dict[Any, Any]) -> bool:
+    has_credentials = None not in map(data.get, CONF_TUYA_DEVICE_KEYS)
+    _LOGGER.debug("Has credentials: %s", has_credentials)
+    return has_credentials
 
 
 class HASSTuyaBLEDeviceManager(AbstractTuyaBLEDeviceManager):
     """Cloud connected manager of the Tuya BLE devices credentials."""
 
-    def __init__(self, hass: HomeAssistant, data: dict[str, Any]) -> None:
+    def __init__(self, hass: HomeAssistant, data: MutableMapping[str, Any]) -> None:
         assert hass is not None
         self._hass = hass
         self._data = data
+        domain_data = hass.data.setdefault(DOMAIN, {})
+        super().__init__(domain_data.setdefault(CREDENTIALS_CACHE, {}))
+        self._cache: dict[tuple, TuyaCloudCacheItem] = domain_data.setdefault(
+            CLOUD_CACHE, {}
+        )
         _LOGGER.debug("Initialized HASSTuyaBLEDeviceManager with data: %s", data)
 
+    def _credentials_cache_account(self) -> str:
+        return self._data.get(CONF_ACCESS_ID, "")
+
     @staticmethod
     def _is_login_success(response: dict[Any, Any]) -> bool:
         success = bool(response.get(TUYA_RESPONSE_SUCCESS, False))
         _LOGGER.debug("Login success check: %s", success)
         return success
 
-    @staticmethod
-    def _get_cache_key(data: dict[str, Any]) -> str:
-        key_dict = {key: data.get(key) for key in CONF_TUYA_LOGIN_KEYS}
-        cache_key = json.dumps(key_dict)
-        _LOGGER.debug("Generated cache key: %s", cache_key)
-        return cache_key
-
-    @staticmethod
-    def _has_login(data: dict[Any, Any]) -> bool:
-        has_login = all(data.get(key) is not None for key in CONF_TUYA_LOGIN_KEYS)
-        _LOGGER.debug("Has login: %s", has_login)
-        return has_login
-
-    @staticmethod
-    def _has_credentials(data: dict[Any, Any]) -> bool:
-        has_credentials = all(data.get(key) is not None for key in CONF_TUYA_DEVICE_KEYS)
-        _LOGGER.debug("Has credentials: %s", has_credentials)
-        return has_credentials
-
     async def _login(self, data: dict[str, Any], add_to_cache: bool) -> dict[Any, Any]:
         """Login into Tuya cloud using credentials from data dictionary."""
-        global _cache
         _LOGGER.debug("Attempting login with data: %s", data)
 
         if len(data) == 0:
@@ -145,6 +177,10 @@ class HASSTuyaBLEDeviceManager(AbstractTuyaBLEDeviceManager):
             auth_type=data.get(CONF_AUTH_TYPE, ""),
         )
         api.set_dev_channel("hass")
+        cache_item = self._cache.get(_get_cache_key(data))
+        if cache_item is not None:
+            # Reuse the HTTP session so relogins keep the pooled connections
+            api.session = cache_item.api.session
         _LOGGER.debug("TuyaOpenAPI initialized with endpoint: %s", data.get(CONF_ENDPOINT, ""))
 
         try:
@@ -166,21 +202,21 @@ class HASSTuyaBLEDeviceManager(AbstractTuyaBLEDeviceManager):
                 auth_type = data[CONF_AUTH_TYPE]
                 if isinstance(auth_type, AuthType):
                     data[CONF_AUTH_TYPE] = auth_type.value
-                cache_key = self._get_cache_key(data)
-                cache_item = _cache.get(cache_key)
+                cache_key = _get_cache_key(data)
+                cache_item = self._cache.get(cache_key)
                 if cache_item:
                     cache_item.api = api
                     cache_item.login = data
                     _LOGGER.debug("Updated cache item for key: %s", cache_key)
                 else:
-                    _cache[cache_key] = TuyaCloudCacheItem(api, data, {})
+                    self._cache[cache_key] = TuyaCloudCacheItem(api, data, {})
                     _LOGGER.debug("Added new cache item for key: %s", cache_key)
 
         return response
 
     def _check_login(self) -> bool:
-        cache_key = self._get_cache_key(self._data)
-        login_exists = _cache.get(cache_key) is not None
+        cache_key = _get_cache_key(self._data)
+        login_exists = self._cache.get(cache_key) is not None
         _LOGGER.debug("Check login for cache key %s: %s", cache_key, login_exists)
         return login_exists
 
@@ -188,110 +224,171 @@ class HASSTuyaBLEDeviceManager(AbstractTuyaBLEDeviceManager):
         _LOGGER.debug("Performing login with add_to_cache=%s", add_to_cache)
         return await self._login(self._data, add_to_cache)
 
+    async def _fetch_device(
+        self,
+        item: TuyaCloudCacheItem,
+        device: dict[str, Any],
+    ) -> tuple[str, dict[str, Any]] | None:
+        """Fetch factory info and specification of a single cloud device."""
+        _LOGGER.debug("Processing device: %s", device)
+        get = item.api.get
+        exec_job = self._hass.async_add_executor_job
+        device_id = device.get("id")
+        async with item.semaphore:
+            try:
+                fi_response = await exec_job(
+                    get, TUYA_API_FACTORY_INFO_URL % device_id
+                )
+                _LOGGER.debug("Factory info response: %s", fi_response)
+            except Exception as e:
+                _LOGGER.error("Error fetching factory info for device %s: %s", device_id, e)
+                return None
+
+            fi_response_result = fi_response.get(TUYA_RESPONSE_RESULT)
+            if not fi_response_result:
+                return None
+            factory_info = fi_response_result[0]
+            if not factory_info or TUYA_FACTORY_INFO_MAC not in factory_info:
+                return None
+
+            h = factory_info[TUYA_FACTORY_INFO_MAC].upper()
+            mac = f"{h[0:2]}:{h[2:4]}:{h[4:6]}:{h[6:8]}:{h[8:10]}:{h[10:12]}"
+            _LOGGER.debug("Parsed MAC address: %s", mac)
+            credentials = {
+                CONF_ADDRESS: mac,
+                CONF_UUID: device.get("uuid"),
+                CONF_LOCAL_KEY: device.get("local_key"),
+                CONF_DEVICE_ID: device_id,
+                CONF_CATEGORY: device.get("category"),
+                CONF_PRODUCT_ID: device.get("product_id"),
+                CONF_DEVICE_NAME: device.get("name"),
+                CONF_PRODUCT_MODEL: device.get("model"),
+                CONF_PRODUCT_NAME: device.get("product_name"),
+            }
+
+            try:
+                spec_response = await exec_job(
+                    get, TUYA_API_DEVICE_SPECIFICATION % device_id
+                )
+                _LOGGER.debug("Specification response: %s", spec_response)
+            except Exception as e:
+                _LOGGER.error("Error fetching specification for device %s: %s", device_id, e)
+                return mac, credentials
+
+        spec_response_result = spec_response.get(TUYA_RESPONSE_RESULT)
+        if spec_response_result:
+            functions = spec_response_result.get("functions")
+            if functions:
+                credentials[CONF_FUNCTIONS] = functions
+                _LOGGER.debug("Updated functions for MAC: %s", mac)
+            status = spec_response_result.get("status")
+            if status:
+                credentials[CONF_STATUS_RANGE] = status
+                _LOGGER.debug("Updated status range for MAC: %s", mac)
+
+        return mac, credentials
+
+    async def _ensure_token(self, item: TuyaCloudCacheItem) -> bool:
+        """Renew the token up front so parallel requests never refresh it."""
+        api = item.api
+        token_info = api.token_info
+        if (
+            api.is_connect() and
+            token_info.expire_time > (time.time() + TUYA_API_TOKEN_MIN_LIFETIME) * 1000
+        ):
+            return True
+        _LOGGER.debug("Token is missing or about to expire, logging in again")
+        login = item.login
+        try:
+            response = await self._hass.async_add_executor_job(
+                api.connect,
+                login.get(CONF_USERNAME, ""),
+                login.get(CONF_PASSWORD, ""),
+                login.get(CONF_COUNTRY_CODE, ""),
+                login.get(CONF_APP_TYPE, ""),
+            )
+        except Exception as e:
+            _LOGGER.error("Error renewing token: %s", e)
+            return False
+        return self._is_login_success(response)
+
     async def _fill_cache_item(self, item: TuyaCloudCacheItem) -> None:
-        _LOGGER.debug("Filling cache item for API token: %s", item.api.token_info.uid)
+        if not await self._ensure_token(item):
+            _LOGGER.error("No valid token, cannot fetch devices")
+            return
+        api = item.api
+        uid = api.token_info.uid
+        _LOGGER.debug("Filling cache item for API token: %s", uid)
         try:
             devices_response = await self._hass.async_add_executor_job(
-                item.api.get,
-                TUYA_API_DEVICES_URL % (item.api.token_info.uid),
+                api.get, TUYA_API_DEVICES_URL % uid
             )
             _LOGGER.debug("Devices response: %s", devices_response)
         except Exception as e:
             _LOGGER.error("Error fetching devices: %s", e)
             return
 
-        if devices_response.get(TUYA_RESPONSE_RESULT):
-            devices = devices_response.get(TUYA_RESPONSE_RESULT)
-            if isinstance(devices, Iterable):
-                for device in devices:
-                    _LOGGER.debug("Processing device: %s", device)
-                    try:
-                        fi_response = await self._hass.async_add_executor_job(
-                            item.api.get,
-                            TUYA_API_FACTORY_INFO_URL % (device.get("id")),
-                        )
-                        _LOGGER.debug("Factory info response: %s", fi_response)
-                    except Exception as e:
-                        _LOGGER.error("Error fetching factory info for device %s: %s", device.get("id"), e)
-                        continue
-
-                    fi_response_result = fi_response.get(TUYA_RESPONSE_RESULT)
-                    if fi_response_result and len(fi_response_result) > 0:
-                        factory_info = fi_response_result[0]
-                        if factory_info and (TUYA_FACTORY_INFO_MAC in factory_info):
-                            mac = ":".join(
-                                factory_info[TUYA_FACTORY_INFO_MAC][i : i + 2]
-                                for i in range(0, 12, 2)
-                            ).upper()
-                            _LOGGER.debug("Parsed MAC address: %s", mac)
-                            item.credentials[mac] = {
-                                CONF_ADDRESS: mac,
-                                CONF_UUID: device.get("uuid"),
-                                CONF_LOCAL_KEY: device.get("local_key"),
-                                CONF_DEVICE_ID: device.get("id"),
-                                CONF_CATEGORY: device.get("category"),
-                                CONF_PRODUCT_ID: device.get("product_id"),
-                                CONF_DEVICE_NAME: device.get("name"),
-                                CONF_PRODUCT_MODEL: device.get("model"),
-                                CONF_PRODUCT_NAME: device.get("product_name"),
-                            }
-                            _LOGGER.debug("Updated credentials for MAC: %s", mac)
-
-                            try:
-                                spec_response = await self._hass.async_add_executor_job(
-                                    item.api.get,
-                                    TUYA_API_DEVICE_SPECIFICATION % device.get("id")
-                                )
-                                _LOGGER.debug("Specification response: %s", spec_response)
-                            except Exception as e:
-                                _LOGGER.error("Error fetching specification for device %s: %s", device.get("id"), e)
-                                continue
-
-                            spec_response_result = spec_response.get(TUYA_RESPONSE_RESULT)
-                            if spec_response_result:
-                                functions = spec_response_result.get("functions")
-                                if functions:
-                                    item.credentials[mac][CONF_FUNCTIONS] = functions
-                                    _LOGGER.debug("Updated functions for MAC: %s", mac)
-                                status = spec_response_result.get("status")
-                                if status:
-                                    item.credentials[mac][CONF_STATUS_RANGE] = status
-                                    _LOGGER.debug("Updated status range for MAC: %s", mac)
+        devices = devices_response.get(TUYA_RESPONSE_RESULT)
+        if devices:
+            results = await asyncio.gather(
+                *(self._fetch_device(item, device) for device in devices),
+                return_exceptions=True,
+            )
+            item.credential_objects.clear()
+            account = item.login.get(CONF_ACCESS_ID, "")
+            for key in [key for key in self._cred_cache if key[0] == account]:
+                del self._cred_cache[key]
+            for result in results:
+                if isinstance(result, BaseException):
+                    _LOGGER.error("Error processing device: %s", result)
+                elif result is not None:
+                    mac, credentials = result
+                    item.credentials[mac] = credentials
+                    _LOGGER.debug("Updated credentials for MAC: %s", mac)
 
     async def build_cache(self) -> None:
-        global _cache
         _LOGGER.debug("Building cache...")
-        data = {}
-        tuya_config_entries = self._hass.config_entries.async_entries(TUYA_DOMAIN)
+        config_entries = self._hass.config_entries
+        tuya_config_entries = config_entries.async_entries(TUYA_DOMAIN)
+        ble_config_entries = config_entries.async_entries(DOMAIN)
+
+        wanted = {
+            _get_cache_key(config_entry.data)
+            for config_entry in tuya_config_entries
+        }
+        wanted.update(
+            _get_cache_key(config_entry.options)
+            for config_entry in ble_config_entries
+        )
+        if all(key in self._cache and self._cache[key].credentials for key in wanted):
+            _LOGGER.debug("Cache is already populated")
+            return
+
         for config_entry in tuya_config_entries:
-            data.clear()
-            data.update(config_entry.data)
+            data = dict(config_entry.data)
             _LOGGER.debug("Processing Tuya config entry: %s", config_entry.entry_id)
-            key = self._get_cache_key(data)
-            item = _cache.get(key)
+            key = _get_cache_key(data)
+            item = self._cache.get(key)
             if item is None or len(item.credentials) == 0:
                 if self._is_login_success(await self._login(data, True)):
-                    item = _cache.get(key)
+                    item = self._cache.get(key)
                     if item and len(item.credentials) == 0:
                         await self._fill_cache_item(item)
 
-        ble_config_entries = self._hass.config_entries.async_entries(DOMAIN)
         for config_entry in ble_config_entries:
-            data.clear()
-            data.update(config_entry.options)
+            data = dict(config_entry.options)
             _LOGGER.debug("Processing BLE config entry: %s", config_entry.entry_id)
-            key = self._get_cache_key(data)
-            item = _cache.get(key)
+            key = _get_cache_key(data)
+            item = self._cache.get(key)
             if item is None or len(item.credentials) == 0:
                 if self._is_login_success(await self._login(data, True)):
-                    item = _cache.get(key)
+                    item = self._cache.get(key)
                     if item and len(item.credentials) == 0:
                         await self._fill_cache_item(item)
 
     def get_login_from_cache(self) -> None:
-        global _cache
         _LOGGER.debug("Retrieving login from cache...")
-        for cache_item in _cache.values():
+        for cache_item in self._cache.values():
             self._data.update(cache_item.login)
             _LOGGER.debug("Updated data with login: %s", cache_item.login)
             break
@@ -303,33 +400,30 @@ class HASSTuyaBLEDeviceManager(AbstractTuyaBLEDeviceManager):
         save_data: bool = False,
     ) -> TuyaBLEDeviceCredentials | None:
         """Get credentials of the Tuya BLE device."""
-        global _cache
-        _LOGGER.debug("Attempting to get credentials for device: %s", address)
-        _LOGGER.debug("Cache contents: %s", _cache)
         _LOGGER.debug("Getting device credentials for address: %s", address)
         item: TuyaCloudCacheItem | None = None
         credentials: dict[str, any] | None = None
         result: TuyaBLEDeviceCredentials | None = None
 
-        if not force_update and self._has_credentials(self._data):
+        if not force_update and _has_credentials(self._data):
             credentials = self._data.copy()
             _LOGGER.debug("Using existing credentials from data.")
         else:
-            cache_key: str | None = None
-            if self._has_login(self._data):
-                cache_key = self._get_cache_key(self._data)
+            cache_key: tuple | None = None
+            if _has_login(self._data):
+                cache_key = _get_cache_key(self._data)
             else:
-                for key in _cache.keys():
-                    if _cache[key].credentials.get(address) is not None:
+                for key in self._cache.keys():
+                    if self._cache[key].credentials.get(address) is not None:
                         cache_key = key
                         break
             if cache_key:
-                item = _cache.get(cache_key)
+                item = self._cache.get(cache_key)
                 _LOGGER.debug("Found cache item for key: %s", cache_key)
 
             if item is None or force_update:
                 if self._is_login_success(await self.login(True)):
-                    item = _cache.get(cache_key)
+                    item = self._cache.get(cache_key)
                     if item:
                         await self._fill_cache_item(item)
 
@@ -338,18 +432,15 @@ class HASSTuyaBLEDeviceManager(AbstractTuyaBLEDeviceManager):
                 _LOGGER.debug("Retrieved credentials for address: %s", address)
 
         if credentials:
-            result = TuyaBLEDeviceCredentials(
-                credentials.get(CONF_UUID, ""),
-                credentials.get(CONF_LOCAL_KEY, ""),
-                credentials.get(CONF_DEVICE_ID, ""),
-                credentials.get(CONF_CATEGORY, ""),
-                credentials.get(CONF_PRODUCT_ID, ""),
-                credentials.get(CONF_DEVICE_NAME, ""),
-                credentials.get(CONF_PRODUCT_MODEL, ""),
-                credentials.get(CONF_PRODUCT_NAME, ""),
-                credentials.get(CONF_FUNCTIONS, []),
-                credentials.get(CONF_STATUS_RANGE, []),
-            )
+            if item:
+                result = item.credential_objects.get(address)
+            if result is None:
+                result = TuyaBLEDeviceCredentials(
+                    *[credentials.get(key, "") for key in _CRED_KEYS],
+                    *[credentials.get(key, []) for key in _CRED_LIST_KEYS],
+                )
+                if item:
+                    item.credential_objects[address] = result
             _LOGGER.debug("Retrieved: %s", result)
             if save_data:
                 if item:
@@ -360,6 +451,6 @@ class HASSTuyaBLEDeviceManager(AbstractTuyaBLEDeviceManager):
         return result
 
     @property
-    def data(self) -> dict[str, Any]:
+    def data(self) -> MutableMapping[str, Any]:
         _LOGGER.debug("Accessing data property.")
         return self._data
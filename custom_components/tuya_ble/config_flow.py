@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+from functools import lru_cache
 import logging
-import pycountry
 from typing import Any
 
 import voluptuous as vol
@@ -19,19 +20,19 @@ from homeassistant.components.bluetooth import (
     async_discovered_service_info,
 )
 from homeassistant.const import (
-    CONF_ADDRESS, 
-    CONF_DEVICE_ID,
+    CONF_ADDRESS,
     CONF_COUNTRY_CODE,
     CONF_PASSWORD,
     CONF_USERNAME,
 )
 from homeassistant.core import callback
-from homeassistant.data_entry_flow import FlowHandler, FlowResult
+from homeassistant.data_entry_flow import FlowResult
 
 from .tuya_ble import SERVICE_UUID, TuyaBLEDeviceCredentials
 
 from .const import (
     TUYA_COUNTRIES,
+    Country,
     TUYA_SMART_APP,
     SMARTLIFE_APP,
     TUYA_RESPONSE_SUCCESS,
@@ -49,6 +50,42 @@ from .cloud import HASSTuyaBLEDeviceManager
 
 _LOGGER = logging.getLogger(__name__)
 
+_TUYA_SERVICE_UUIDS: frozenset[str] = frozenset({SERVICE_UUID})
+
+
+class _CountryRegistry:
+    """Precomputed views of the supported Tuya countries."""
+
+    __slots__ = ("by_name", "names")
+
+    def __init__(self, countries: list[Country]) -> None:
+        self.by_name: dict[str, Country] = {c.name: c for c in countries}
+        self.names: tuple[str, ...] = tuple(c.name for c in countries)
+
+
+_COUNTRIES = _CountryRegistry(TUYA_COUNTRIES)
+
+# App types tried concurrently first, then the custom project fallback
+_LOGIN_APP_TYPES: tuple[str, ...] = (TUYA_SMART_APP, SMARTLIFE_APP)
+_FALLBACK_APP_TYPE: str = ""
+_AUTH_BY_APP = {
+    TUYA_SMART_APP: AuthType.SMART_HOME,
+    SMARTLIFE_APP: AuthType.SMART_HOME,
+    _FALLBACK_APP_TYPE: AuthType.CUSTOM,
+}
+
+
+@lru_cache(maxsize=256)
+def _country_name_for_alpha2(code: str | None) -> str | None:
+    """Return the country name for an ISO 3166 alpha-2 code."""
+    if not code:
+        return None
+    # pycountry loads its ISO 3166 data on import, so defer it until needed
+    import pycountry
+
+    country = pycountry.countries.get(alpha_2=code)
+    return country.name if country else None
+
 
 async def _try_login(
     manager: HASSTuyaBLEDeviceManager,
@@ -60,17 +97,12 @@ async def _try_login(
     response: dict[Any, Any] | None
     data: dict[str, Any]
 
-    try:
-        country = [
-            country
-            for country in TUYA_COUNTRIES
-            if country.name == user_input[CONF_COUNTRY_CODE]
-        ][0]
-        _LOGGER.debug("Selected country: %s", country)
-    except IndexError:
+    country = _COUNTRIES.by_name.get(user_input[CONF_COUNTRY_CODE])
+    if country is None:
         _LOGGER.error("Country code not found in TUYA_COUNTRIES: %s", user_input[CONF_COUNTRY_CODE])
         errors["base"] = "invalid_country_code"
         return None
+    _LOGGER.debug("Selected country: %s", country)
 
     data = {
         CONF_ENDPOINT: country.endpoint,
@@ -83,20 +115,45 @@ async def _try_login(
     }
     _LOGGER.debug("Login data prepared: %s", data)
 
-    for app_type in (TUYA_SMART_APP, SMARTLIFE_APP, ""):
-        data[CONF_APP_TYPE] = app_type
-        if app_type == "":
-            data[CONF_AUTH_TYPE] = AuthType.CUSTOM
-        else:
-            data[CONF_AUTH_TYPE] = AuthType.SMART_HOME
-
+    # Smart home app logins are independent, so race them and keep the
+    # first one that succeeds.
+    tasks: dict[asyncio.Task, dict[str, Any]] = {}
+    for app_type in _LOGIN_APP_TYPES:
+        app_data = {
+            **data,
+            CONF_APP_TYPE: app_type,
+            CONF_AUTH_TYPE: _AUTH_BY_APP[app_type],
+        }
         _LOGGER.debug("Attempting login with app type: %s", app_type)
-        response = await manager._login(data, True)
-        _LOGGER.debug("Login response: %s", response)
+        tasks[asyncio.create_task(manager._login(app_data, True))] = app_data
 
-        if response.get(TUYA_RESPONSE_SUCCESS, False):
-            _LOGGER.debug("Login successful with app type: %s", app_type)
-            return data
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                response = task.result()
+                _LOGGER.debug("Login response: %s", response)
+                if response.get(TUYA_RESPONSE_SUCCESS, False):
+                    app_data = tasks[task]
+                    _LOGGER.debug(
+                        "Login successful with app type: %s", app_data[CONF_APP_TYPE]
+                    )
+                    return app_data
+    finally:
+        for task in pending:
+            task.cancel()
+
+    data[CONF_APP_TYPE] = _FALLBACK_APP_TYPE
+    data[CONF_AUTH_TYPE] = _AUTH_BY_APP[_FALLBACK_APP_TYPE]
+    _LOGGER.debug("Attempting login with custom auth type")
+    response = await manager._login(data, True)
+    _LOGGER.debug("Login response: %s", response)
+    if response.get(TUYA_RESPONSE_SUCCESS, False):
+        _LOGGER.debug("Login successful with custom auth type")
+        return data
 
     errors["base"] = "login_error"
     if response:
@@ -125,11 +182,9 @@ async def _show_login_form(
 
     def_country_name: str | None = None
     try:
-        def _get_country():
-            country = pycountry.countries.get(alpha_2=flow.hass.config.country)
-            return country.name if country else None
-        
-        def_country_name = await flow.hass.async_add_executor_job(_get_country)
+        def_country_name = await flow.hass.async_add_executor_job(
+            _country_name_for_alpha2, flow.hass.config.country
+        )
         _LOGGER.debug("Default country name determined: %s", def_country_name)
     except Exception as e:
         _LOGGER.error("Error determining default country name: %s", e)
@@ -140,7 +195,7 @@ async def _show_login_form(
             vol.Required(
                 CONF_COUNTRY_CODE,
                 default=user_input.get(CONF_COUNTRY_CODE, def_country_name),
-            ): vol.In([country.name for country in TUYA_COUNTRIES]),
+            ): vol.In(_COUNTRIES.names),
             vol.Required(
                 CONF_ACCESS_ID,
                 default=user_input.get(CONF_ACCESS_ID, "")
@@ -211,18 +266,16 @@ class TuyaBLEOptionsFlow(OptionsFlowWithConfigEntry):
                         _LOGGER.debug("Device credentials obtained: %s", credentials)
                         return self.async_create_entry(
                             title=self.config_entry.title,
-                            data=entry.manager.data,
+                            data=dict(entry.manager.data),
                         )
                     else:
                         _LOGGER.debug("Device not registered")
                         errors["base"] = "device_not_registered"
-
-        if user_input is None:
-            user_input = {}
-            user_input.update(self.config_entry.options)
+        else:
+            user_input = dict(self.config_entry.options)
             _LOGGER.debug("User input updated with config entry options: %s", user_input)
 
-        return _show_login_form(self, user_input, errors, placeholders)
+        return await _show_login_form(self, user_input, errors, placeholders)
 
 
 class TuyaBLEConfigFlow(ConfigFlow, domain=DOMAIN):
@@ -230,6 +283,18 @@ class TuyaBLEConfigFlow(ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    # ConfigFlow itself keeps a __dict__; slots only cover our own state
+    __slots__ = (
+        "_discovery_info",
+        "_discovered_devices",
+        "_data",
+        "_manager",
+        "_get_device_info_error",
+        "_name_cache",
+        "_cache_built",
+        "_device_options",
+    )
+
     def __init__(self) -> None:
         """Initialize the config flow."""
         super().__init__()
@@ -238,49 +303,65 @@ class TuyaBLEConfigFlow(ConfigFlow, domain=DOMAIN):
         self._data: dict[str, Any] = {}
         self._manager: HASSTuyaBLEDeviceManager | None = None
         self._get_device_info_error = False
+        self._name_cache: dict[str, str] = {}
+        self._cache_built = False
+        self._device_options: dict[str, str] | None = None
         _LOGGER.debug("Initialized TuyaBLEConfigFlow")
 
+    async def _ensure_manager(self) -> None:
+        """Create the device manager and build its cache once per flow."""
+        if self._manager is None:
+            self._manager = HASSTuyaBLEDeviceManager(self.hass, self._data)
+            _LOGGER.debug("Manager initialized: %s", self._manager)
+        if not self._cache_built:
+            await self._manager.build_cache()
+            self._cache_built = True
+            _LOGGER.debug("Cache built for manager")
+
+    async def _readable_name(self, info: BluetoothServiceInfoBleak) -> str:
+        """Return the readable name of a device, cached per address."""
+        name = self._name_cache.get(info.address)
+        if name is None:
+            name = await get_device_readable_name(info, self._manager)
+            self._name_cache[info.address] = name
+        return name
+
     async def async_step_bluetooth(self, discovery_info: BluetoothServiceInfoBleak) -> FlowResult:
         """Handle the bluetooth discovery step."""
-        _LOGGER.debug(
-            "Bluetooth discovery step for device %s: service_data=%s, service_uuids=%s", 
-            discovery_info.address,
-            discovery_info.service_data,
-            discovery_info.service_uuids
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Bluetooth discovery step for device %s: service_data=%s, service_uuids=%s",
+                discovery_info.address,
+                discovery_info.service_data,
+                discovery_info.service_uuids
+            )
 
         await self.async_set_unique_id(discovery_info.address)
         self._abort_if_unique_id_configured()
         self._discovery_info = discovery_info
 
-        # Initialize manager if needed
-        if self._manager is None:
-            self._manager = HASSTuyaBLEDeviceManager(self.hass, self._data)
-            _LOGGER.debug("Manager initialized for device %s", discovery_info.address)
-
-        # Build cache and log the process
-        await self._manager.build_cache()
-        _LOGGER.debug("Cache built for device %s", discovery_info.address)
+        await self._ensure_manager()
 
         # Set title placeholders and log them
-        device_name = await get_device_readable_name(discovery_info, self._manager)
+        device_name = await self._readable_name(discovery_info)
         self.context["title_placeholders"] = {"name": device_name}
-        _LOGGER.debug(
-            "Device %s details: name=%s, manufacturer=%s", 
-            discovery_info.address,
-            device_name,
-            discovery_info.manufacturer_data if hasattr(discovery_info, 'manufacturer_data') else 'N/A'
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Device %s details: name=%s, manufacturer=%s", 
+                discovery_info.address,
+                device_name,
+                discovery_info.manufacturer_data if hasattr(discovery_info, 'manufacturer_data') else 'N/A'
+            )
 
-        # Additional debug information for service data
-        if discovery_info.service_data:
-            for uuid, data in discovery_info.service_data.items():
-                _LOGGER.debug(
-                    "Device %s service data - UUID: %s, Data: %s",
-                    discovery_info.address,
-                    uuid,
-                    data.hex() if isinstance(data, bytes) else data
-                )
+            # Additional debug information for service data
+            if discovery_info.service_data:
+                for uuid, data in discovery_info.service_data.items():
+                    _LOGGER.debug(
+                        "Device %s service data - UUID: %s, Data: %s",
+                        discovery_info.address,
+                        uuid,
+                        data.hex() if isinstance(data, bytes) else data
+                    )
 
         return await self.async_step_login()
 
@@ -289,21 +370,7 @@ class TuyaBLEConfigFlow(ConfigFlow, domain=DOMAIN):
     ) -> FlowResult:
         """Handle the user step."""
         _LOGGER.debug("User step with user input: %s", user_input)
-        if user_input is None:
-            # Initialize manager before proceeding to login step
-            if self._manager is None:
-                self._manager = HASSTuyaBLEDeviceManager(self.hass, self._data)
-                _LOGGER.debug("Manager initialized: %s", self._manager)
-            await self._manager.build_cache()
-            _LOGGER.debug("Cache built for manager")
-            return await self.async_step_login()
-
-        # Rest of the method remains unchanged
-        if self._manager is None:
-            self._manager = HASSTuyaBLEDeviceManager(self.hass, self._data)
-            _LOGGER.debug("Manager initialized: %s", self._manager)
-        await self._manager.build_cache()
-        _LOGGER.debug("Cache built for manager")
+        await self._ensure_manager()
         return await self.async_step_login()
 
     async def async_step_login(
@@ -315,11 +382,7 @@ class TuyaBLEConfigFlow(ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
         placeholders: dict[str, Any] = {}
 
-        # Ensure manager is initialized
-        if self._manager is None:
-            self._manager = HASSTuyaBLEDeviceManager(self.hass, self._data)
-            await self._manager.build_cache()
-            _LOGGER.debug("Manager initialized and cache built")
+        await self._ensure_manager()
 
         if user_input is not None:
             data = await _try_login(
@@ -331,6 +394,9 @@ class TuyaBLEConfigFlow(ConfigFlow, domain=DOMAIN):
             if data:
                 _LOGGER.debug("Login data obtained: %s", data)
                 self._data.update(data)
+                # Names resolved before login may lack cloud product info
+                self._name_cache.clear()
+                self._device_options = None
                 if self._discovery_info is not None:
                     _LOGGER.debug("Discovery service_data: %s", self._discovery_info.service_data)
                 else:
@@ -339,7 +405,6 @@ class TuyaBLEConfigFlow(ConfigFlow, domain=DOMAIN):
                 return await self.async_step_device()
 
         if user_input is None:
-            user_input = {}
             if self._discovery_info:
                 await self._manager.get_device_credentials(
                     self._discovery_info.address,
@@ -347,12 +412,11 @@ class TuyaBLEConfigFlow(ConfigFlow, domain=DOMAIN):
                     True,
                 )
                 _LOGGER.debug("Device credentials obtained for discovery info")
-            if self._data is None or len(self._data) == 0:
+            if not self._data:
                 self._manager.get_login_from_cache()
                 _LOGGER.debug("Login data retrieved from cache")
-            if self._data is not None and len(self._data) > 0:
-                user_input.update(self._data)
-                _LOGGER.debug("User input updated with cached data: %s", user_input)
+            user_input = dict(self._data)
+            _LOGGER.debug("User input updated with cached data: %s", user_input)
 
         return await _show_login_form(self, user_input, errors, placeholders)
 
@@ -366,7 +430,7 @@ class TuyaBLEConfigFlow(ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             address = user_input[CONF_ADDRESS]
             discovery_info = self._discovered_devices[address]
-            local_name = await get_device_readable_name(discovery_info, self._manager)
+            local_name = await self._readable_name(discovery_info)
             _LOGGER.debug("Device selected: %s, local name: %s", address, local_name)
             await self.async_set_unique_id(
                 discovery_info.address, raise_on_progress=False
@@ -389,32 +453,43 @@ class TuyaBLEConfigFlow(ConfigFlow, domain=DOMAIN):
                 )
 
         if discovery := self._discovery_info:
+            if discovery.address not in self._discovered_devices:
+                self._device_options = None
             self._discovered_devices[discovery.address] = discovery
             _LOGGER.debug("Discovery info added to discovered devices: %s", discovery)
         else:
             current_addresses = self._async_current_ids()
             _LOGGER.debug("Current addresses: %s", current_addresses)
+            known = set(current_addresses)
+            known.update(self._discovered_devices)
+            debug = _LOGGER.isEnabledFor(logging.DEBUG)
             for discovery in async_discovered_service_info(self.hass):
-                _LOGGER.debug("Evaluating discovery: %s", discovery)
-                _LOGGER.debug("Discovery service_data: %s", discovery.service_data)
-                _LOGGER.debug("Discovery service_uuids: %s", discovery.service_uuids)
-                
-                if (
-                    discovery.address in current_addresses
-                    or discovery.address in self._discovered_devices
-                    or discovery.service_data is None
-                    or not SERVICE_UUID in discovery.service_data.keys()
-                ):
+                if debug:
                     _LOGGER.debug(
-                        "Skipping device %s: already configured=%s, already discovered=%s, no service data=%s, no service uuid=%s",
-                        discovery.address,
-                        discovery.address in current_addresses,
-                        discovery.address in self._discovered_devices,
-                        discovery.service_data is None,
-                        not SERVICE_UUID in discovery.service_data.keys() if discovery.service_data else True
+                        "Evaluating discovery: %s, service_data: %s, service_uuids: %s",
+                        discovery,
+                        discovery.service_data,
+                        discovery.service_uuids,
                     )
+
+                if (
+                    discovery.address in known
+                    or not discovery.service_data
+                    or discovery.service_data.keys().isdisjoint(_TUYA_SERVICE_UUIDS)
+                ):
+                    if debug:
+                        _LOGGER.debug(
+                            "Skipping device %s: already configured=%s, already discovered=%s, no service data=%s, no service uuid=%s",
+                            discovery.address,
+                            discovery.address in current_addresses,
+                            discovery.address in self._discovered_devices,
+                            not discovery.service_data,
+                            _TUYA_SERVICE_UUIDS.isdisjoint(discovery.service_data or ()),
+                        )
                     continue
                 self._discovered_devices[discovery.address] = discovery
+                self._device_options = None
+                known.add(discovery.address)
                 _LOGGER.debug("Discovered device added: %s", discovery)
 
         if not self._discovered_devices:
@@ -427,9 +502,16 @@ class TuyaBLEConfigFlow(ConfigFlow, domain=DOMAIN):
         if user_input:
             def_address = user_input.get(CONF_ADDRESS)
         else:
-            def_address = list(self._discovered_devices)[0]
+            def_address = next(iter(self._discovered_devices))
         _LOGGER.debug("Default address for device selection: %s", def_address)
 
+        if self._device_options is None:
+            infos = list(self._discovered_devices.values())
+            names = await asyncio.gather(
+                *(self._readable_name(info) for info in infos)
+            )
+            self._device_options = dict(zip((info.address for info in infos), names))
+
         return self.async_show_form(
             step_id="device",
             data_schema=vol.Schema(
@@ -437,15 +519,7 @@ class TuyaBLEConfigFlow(ConfigFlow, domain=DOMAIN):
                     vol.Required(
                         CONF_ADDRESS,
                         default=def_address,
-                    ): vol.In(
-                        {
-                            service_info.address: await get_device_readable_name(
-                                service_info,
-                                self._manager,
-                            )
-                            for service_info in self._discovered_devices.values()
-                        }
-                    ),
+                    ): vol.In(self._device_options),
                 },
             ),
             errors=errors,
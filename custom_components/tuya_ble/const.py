@@ -12,6 +12,8 @@ from dataclasses import dataclass
 _LOGGER = logging.getLogger(__name__)
 
 DOMAIN: Final = "tuya_ble"
+CLOUD_CACHE: Final = "_cloud_cache"
+CREDENTIALS_CACHE: Final = "_credentials_cache"
 
 DEVICE_METADATA_UUIDS: Final = "uuids"
 
@@ -49,6 +51,9 @@ TUYA_API_DEVICES_URL: Final = "/v1.0/users/%s/devices"
 TUYA_API_FACTORY_INFO_URL: Final = "/v1.0/iot-03/devices/factory-infos?device_ids=%s"
 TUYA_API_DEVICE_SPECIFICATION: Final = "/v1.1/devices/%s/specifications"
 TUYA_FACTORY_INFO_MAC: Final = "mac"
+TUYA_API_MAX_PARALLEL_REQUESTS: Final = 8
+# Minimal remaining token lifetime (s) before fanning out parallel requests
+TUYA_API_TOKEN_MIN_LIFETIME: Final = 300
 
 BATTERY_STATE_LOW: Final = "low"
 BATTERY_STATE_NORMAL: Final = "normal"
@@ -310,6 +310,8 @@ class TuyaBLEData:
     product: TuyaBLEProductInfo
     manager: HASSTuyaBLEDeviceManager
     coordinator: TuyaBLECoordinator
+    # Cloud login of the entry options the integration was set up with
+    login_key: tuple | None = None
 
 
 @dataclass
@@ -557,7 +559,9 @@ async def get_device_readable_name(
     credentials: TuyaBLEDeviceCredentials | None = None
     product_info: TuyaBLEProductInfo | None = None
     if manager:
-        credentials = await manager.get_device_credentials(discovery_info.address)
+        credentials = await manager.get_device_credentials_cached(
+            discovery_info.address
+        )
         _LOGGER.debug("Device credentials obtained: %s", credentials)
         if credentials:
             product_info = get_product_info_by_ids(
@@ -1,11 +1,11 @@
 """The Tuya BLE integration."""
 from __future__ import annotations
 
+import dataclasses
 from dataclasses import dataclass, field
 
 import logging
 import json
-import copy
 import asyncio
 
 from typing import Any, Callable, cast
@@ -48,8 +48,14 @@ from datetime import timedelta
 
 _LOGGER = logging.getLogger(__name__)
 
+# Seconds to wait for the device to connect, per registration attempt
+REGISTRATION_TIMEOUT = 10
+
+# Only on/off is implemented by TuyaBLELight, shared by all the entities
+_SUPPORTED_COLOR_MODES: frozenset[ColorMode] = frozenset({ColorMode.ONOFF})
+
 # Most of the code here is identical to the one from the Tuya cloud Light component
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ColorTypeData:
     """Color Type Data."""
 
@@ -71,7 +77,7 @@ DEFAULT_COLOR_TYPE_DATA_V2 = ColorTypeData(
 )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ColorData:
     """Color Data."""
 
@@ -79,21 +85,36 @@ class ColorData:
     h_value: int
     s_value: int
     v_value: int
+    _hs_color: tuple[float, float] = field(init=False, repr=False, compare=False)
+    _brightness: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the derived values, the fields are immutable."""
+        object.__setattr__(
+            self,
+            "_hs_color",
+            (
+                self.type_data.h_type.remap_value_to(self.h_value, 0, 360),
+                self.type_data.s_type.remap_value_to(self.s_value, 0, 100),
+            ),
+        )
+        object.__setattr__(
+            self,
+            "_brightness",
+            round(self.type_data.v_type.remap_value_to(self.v_value, 0, 255)),
+        )
 
     @property
     def hs_color(self) -> tuple[float, float]:
         """Get the HS value from this color data."""
-        return (
-            self.type_data.h_type.remap_value_to(self.h_value, 0, 360),
-            self.type_data.s_type.remap_value_to(self.s_value, 0, 100),
-        )
+        return self._hs_color
 
     @property
     def brightness(self) -> int:
         """Get the brightness value from this color data."""
-        return round(self.type_data.v_type.remap_value_to(self.v_value, 0, 255))
+        return self._brightness
 
-@dataclass
+@dataclass(frozen=True)
 class TuyaLightEntityDescription(
             TuyaBLEEntityDescription, 
             LightEntityDescription
@@ -456,13 +477,12 @@ LIGHTS["pc"] = LIGHTS["kg"]
 # both tuple should have the same size
 def update_mapping(category_description: tuple[TuyaLightEntityDescription], mapping: tuple[TuyaLightEntityDescription]) -> tuple[TuyaLightEntityDescription]:
     _LOGGER.debug("Updating mapping with category_description: %s, mapping: %s", category_description, mapping)
-    m = tuple()
-    l = list(category_description)
+    result: list[TuyaLightEntityDescription] = []
+    remaining = iter(category_description)
     for desc in mapping:
-        cat_desc = l.pop(0)
+        cat_desc = next(remaining)
         if desc.key == "":
-            cat_desc = copy.deepcopy(cat_desc)
-            
+            overrides: dict[str, Any] = {}
             for key in [
                         "brightness_max", 
                         "brightness_min", 
@@ -471,49 +491,54 @@ def update_mapping(category_description: tuple[TuyaLightEntityDescription], mapp
                         "color_temp", 
                     ]:
                 if v := getattr(desc, key):
-                    setattr(cat_desc, key, v)
+                    overrides[key] = v
 
             for key in [
                         "function", 
                         "status_range", 
                     ]:
-                if v := getattr(desc, key):
-                    l = getattr(desc, key)
-                    if l:
-                        l.append(v)
-                    else:
-                        l = v
-                    setattr(cat_desc, key, l)
+                if new := getattr(desc, key):
+                    existing = getattr(cat_desc, key)
+                    overrides[key] = [*existing, *new] if existing else new
 
             for key in [
                         "values_overrides", 
                         "values_defaults", 
                     ]:
-                if v := getattr(desc, key):
-                    l = getattr(desc, key)
-                    if l:
-                        l.update(v)
-                    else:
-                        l = v
-                    setattr(cat_desc, key, l)
+                if new := getattr(desc, key):
+                    existing = getattr(cat_desc, key)
+                    overrides[key] = {**existing, **new} if existing else new
 
-            desc = cat_desc
+            # Fields without overrides keep referencing the category values
+            desc = dataclasses.replace(cat_desc, **overrides)
 
-        m = m + (desc,)
+        result.append(desc)
 
-    return m
+    return tuple(result)
+
+# Category descriptions with the product overrides already applied
+_RESOLVED_MAPPINGS: dict[tuple[str, str], tuple[TuyaLightEntityDescription, ...]] = {
+    (category, product_id): update_mapping(LIGHTS[category], overrides)
+    for category, products in ProductsMapping.items()
+    if category in LIGHTS
+    for product_id, overrides in products.items()
+}
 
 def get_mapping_by_device(device: TuyaBLEDevice) -> tuple[TuyaLightEntityDescription]:
-    _LOGGER.debug("Getting mapping by device: %s", device)
     category_mapping = LIGHTS.get(device.category)
-
-    category = ProductsMapping.get(device.category)
-    if category is not None:
-        product_mapping_overrides = category.get(device.product_id)
-        if product_mapping_overrides is not None:
-             return update_mapping(category_mapping, product_mapping_overrides)
-             
-    return category_mapping
+    products = ProductsMapping.get(device.category)
+    if products is None or device.product_id not in products:
+        return category_mapping
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug(
+            "%s: Using product overrides for %s",
+            device.address,
+            device.product_id,
+        )
+    # Descriptions are shared between devices and must not be mutated
+    return _RESOLVED_MAPPINGS.get(
+        (device.category, device.product_id), category_mapping
+    )
 
 
 class TuyaBLELight(TuyaBLEEntity, LightEntity):
@@ -525,23 +550,34 @@ class TuyaBLELight(TuyaBLEEntity, LightEntity):
         coordinator: DataUpdateCoordinator,
         device: TuyaBLEDevice,
         product: TuyaBLEProductInfo,
-        description: TuyaBLEEntityDescription,
+        description: TuyaLightEntityDescription,
     ) -> None:
         """Initialize the light."""
-        _LOGGER.debug("Initializing TuyaBLELight with device: %s, product: %s, description: %s", device, product, description)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Initializing TuyaBLELight with device: %s, product: %s, description: %s", device, product, description)
         super().__init__(hass, coordinator, device, product, description)
         
         self._attr_available = False
-        self._attr_supported_color_modes = {ColorMode.ONOFF}
+        self._attr_supported_color_modes = _SUPPORTED_COLOR_MODES
         self._registered = False
         self._init_retry_count = 0
         self._max_init_retries = 3
-        _LOGGER.debug("TuyaBLELight initialized with available: %s, supported_color_modes: %s", self._attr_available, self._attr_supported_color_modes)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("TuyaBLELight initialized with available: %s, supported_color_modes: %s", self._attr_available, self._attr_supported_color_modes)
 
     async def async_added_to_hass(self) -> None:
         """Run when entity is added to hass."""
         _LOGGER.debug("Entity added to hass for device: %s", self._device.address)
         await super().async_added_to_hass()
+        # Don't hold up the platform setup while the device connects
+        task = self.hass.async_create_background_task(
+            self._async_register(),
+            f"{DOMAIN} light registration {self._device.address}",
+        )
+        self.async_on_remove(task.cancel)
+
+    async def _async_register(self) -> None:
+        """Verify the device registration and publish the availability."""
         try:
             await self._verify_registration()
         except Exception as err:
@@ -552,49 +588,29 @@ class TuyaBLELight(TuyaBLEEntity, LightEntity):
                 exc_info=True
             )
             self._attr_available = False
-        _LOGGER.debug(
-            "%s: Light entity added to HASS - unique_id: %s, registered: %s, available: %s",
-            self._device.address,
-            self._attr_unique_id,
-            self._registered,
-            self._attr_available
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%s: Light entity registration done - unique_id: %s, registered: %s, available: %s",
+                self._device.address,
+                self._attr_unique_id,
+                self._registered,
+                self._attr_available
+            )
+        self.async_write_ha_state()
 
     async def _verify_registration(self) -> None:
         """Verify device registration status."""
-        _LOGGER.debug(
-            "%s: Starting registration verification (attempt %d/%d)",
-            self._device.address,
-            self._init_retry_count + 1,
-            self._max_init_retries
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%s: Starting registration verification (attempt %d/%d)",
+                self._device.address,
+                self._init_retry_count + 1,
+                self._max_init_retries
+            )
         
         while not self._registered and self._init_retry_count < self._max_init_retries:
             try:
-                async with asyncio.timeout(30):
-                    _LOGGER.debug(
-                        "%s: Attempting to verify registration with device",
-                        self._device.address
-                    )
-                    
-                    # Check if device is connected and authenticated
-                    if not self._device.is_connected:
-                        _LOGGER.debug("%s: Device not connected, attempting to connect", self._device.address)
-                        await self._device.connect()
-                    
-                    if not await self._device.authenticate():
-                        _LOGGER.error("%s: Failed to authenticate with device", self._device.address)
-                        raise HomeAssistantError("Failed to authenticate with device")
-                        
-                    self._registered = True
-                    self._attr_available = True
-                    
-                    _LOGGER.debug(
-                        "%s: Device successfully registered and available",
-                        self._device.address
-                    )
-                    return
-                    
+                await self._device.async_register(REGISTRATION_TIMEOUT)
             except asyncio.TimeoutError:
                 self._init_retry_count += 1
                 _LOGGER.warning(
@@ -603,17 +619,16 @@ class TuyaBLELight(TuyaBLEEntity, LightEntity):
                     self._init_retry_count,
                     self._max_init_retries
                 )
-            except Exception as err:
-                self._init_retry_count += 1
-                _LOGGER.error(
-                    "%s: Failed to verify device registration: %s",
-                    self._device.address,
-                    self._init_retry_count,
-                    self._max_init_retries,
-                    str(err),
-                    exc_info=True
-                )
-                
+                continue
+
+            self._registered = self._device.is_registered
+            self._attr_available = True
+            _LOGGER.debug(
+                "%s: Device successfully registered and available",
+                self._device.address
+            )
+            return
+
         if not self._registered:
             _LOGGER.error(
                 "%s: Device registration verification failed after %d attempts",
@@ -623,11 +638,12 @@ class TuyaBLELight(TuyaBLEEntity, LightEntity):
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the light on."""
-        _LOGGER.debug(
-            "%s: Turn on requested with parameters: %s",
-            self._device.address,
-            kwargs
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%s: Turn on requested with parameters: %s",
+                self._device.address,
+                kwargs
+            )
         
         if not self._registered:
             _LOGGER.error(
@@ -639,15 +655,17 @@ class TuyaBLELight(TuyaBLEEntity, LightEntity):
             )
             
         try:
-            _LOGGER.debug(
-                "%s: Executing turn on command",
-                self._device.address
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "%s: Executing turn on command",
+                    self._device.address
+                )
             await super().async_turn_on(**kwargs)
-            _LOGGER.debug(
-                "%s: Turn on successful",
-                self._device.address
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "%s: Turn on successful",
+                    self._device.address
+                )
         except Exception as err:
             self._attr_available = False
             self.async_write_ha_state()
@@ -661,10 +679,11 @@ class TuyaBLELight(TuyaBLEEntity, LightEntity):
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the light off."""
-        _LOGGER.debug(
-            "%s: Turn off requested",
-            self._device.address
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%s: Turn off requested",
+                self._device.address
+            )
         
         if not self._registered:
             _LOGGER.error(
@@ -676,15 +695,17 @@ class TuyaBLELight(TuyaBLEEntity, LightEntity):
             )
             
         try:
-            _LOGGER.debug(
-                "%s: Executing turn off command",
-                self._device.address
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "%s: Executing turn off command",
+                    self._device.address
+                )
             await super().async_turn_off(**kwargs)
-            _LOGGER.debug(
-                "%s: Turn off successful",
-                self._device.address
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "%s: Turn off successful",
+                    self._device.address
+                )
         except Exception as err:
             self._attr_available = False 
             self.async_write_ha_state()
@@ -698,13 +719,14 @@ class TuyaBLELight(TuyaBLEEntity, LightEntity):
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        _LOGGER.debug(
-            "%s: Handling coordinator update - previous state: %s, new state: %s, connection state: %s",
-            self._device.address,
-            getattr(self, '_attr_state', 'Unknown'),
-            self._device.status if hasattr(self._device, 'status') else 'Unknown',
-            "Connected" if self._device.is_connected else "Disconnected"
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            dev = self._device
+            _LOGGER.debug(
+                "%s: coord update state=%s connected=%s",
+                dev.address,
+                getattr(dev, "status", None),
+                getattr(dev, "is_connected", None),
+            )
         super()._handle_coordinator_update()
 
 async def async_setup_entry(
@@ -713,14 +735,13 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the Tuya BLE lights."""
+    data: TuyaBLEData = hass.data[DOMAIN][entry.entry_id]
     _LOGGER.debug(
         "Setting up lights for device %s with product info: %s",
         entry.entry_id,
-        hass.data[DOMAIN][entry.entry_id].product
+        data.product
     )
 
-    data: TuyaBLEData = hass.data[DOMAIN][entry.entry_id]
-
     try:
         descs = get_mapping_by_device(data.device)
         _LOGGER.debug(
@@ -737,35 +758,33 @@ async def async_setup_entry(
         )
         return
 
-    entities: list[TuyaBLELight] = []
-
-    for desc in descs:
-        _LOGGER.debug(
-            "%s: Creating light entity with description: %s",
-            data.device.address,
-            desc
-        )
-        try:
-            entity = TuyaBLELight(
+    try:
+        entities: list[TuyaBLELight] = [
+            TuyaBLELight(
                 hass,
                 data.coordinator,
                 data.device,
                 data.product,
                 desc,
             )
-            entities.append(entity)
+            for desc in descs or ()
+        ]
+    except Exception as e:
+        _LOGGER.error(
+            "%s: Failed to create light entities: %s",
+            data.device.address,
+            str(e),
+            exc_info=True
+        )
+        return
+
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        for entity in entities:
             _LOGGER.debug(
                 "%s: Successfully created light entity: %s",
                 data.device.address,
                 entity._attr_unique_id
             )
-        except Exception as e:
-            _LOGGER.error(
-                "%s: Failed to create light entity: %s",
-                data.device.address,
-                str(e),
-                exc_info=True
-            )
 
     if entities:
         _LOGGER.debug(
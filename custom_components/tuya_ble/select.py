@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from types import MappingProxyType
 
 import logging
 
@@ -28,7 +29,7 @@ from .tuya_ble import TuyaBLEDataPointType, TuyaBLEDevice
 _LOGGER = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class TuyaBLESelectMapping:
     dp_id: int
     description: SelectEntityDescription
@@ -41,52 +42,55 @@ class TemperatureUnitDescription(SelectEntityDescription):
     key: str = "temperature_unit"
     icon: str = "mdi:thermometer"
     entity_category: EntityCategory = EntityCategory.CONFIG
+    options: tuple[str, ...] = (
+        UnitOfTemperature.CELSIUS,
+        UnitOfTemperature.FAHRENHEIT,
+    )
 
 
-@dataclass
+# Descriptions shared by every mapping that uses them
+_TEMPERATURE_UNIT_DESCRIPTION = TemperatureUnitDescription()
+
+_FINGERBOT_MODE_DESCRIPTION = SelectEntityDescription(
+    key="fingerbot_mode",
+    entity_category=EntityCategory.CONFIG,
+    options=(
+        FINGERBOT_MODE_PUSH,
+        FINGERBOT_MODE_SWITCH,
+        FINGERBOT_MODE_PROGRAM,
+    ),
+)
+
+
+@dataclass(slots=True)
 class TuyaBLEFingerbotModeMapping(TuyaBLESelectMapping):
     description: SelectEntityDescription = field(
-        default_factory=lambda: SelectEntityDescription(
-            key="fingerbot_mode",
-            entity_category=EntityCategory.CONFIG,
-            options=
-                [
-                    FINGERBOT_MODE_PUSH, 
-                    FINGERBOT_MODE_SWITCH,
-                    FINGERBOT_MODE_PROGRAM,
-                ],
-        )
+        default_factory=lambda: _FINGERBOT_MODE_DESCRIPTION
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class TuyaBLECategorySelectMapping:
     products: dict[str, list[TuyaBLESelectMapping]] | None = None
     mapping: list[TuyaBLESelectMapping] | None = None
 
 
-mapping: dict[str, TuyaBLECategorySelectMapping] = {
+mapping: MappingProxyType[str, TuyaBLECategorySelectMapping] = MappingProxyType({
     "co2bj": TuyaBLECategorySelectMapping(
         products={
             "59s19z5m":  # CO2 Detector
             [
                 TuyaBLESelectMapping(
                     dp_id=101,
-                    description=TemperatureUnitDescription(
-                        options=[
-                            UnitOfTemperature.CELSIUS,
-                            UnitOfTemperature.FAHRENHEIT,
-                        ],
-                    )
+                    description=_TEMPERATURE_UNIT_DESCRIPTION,
                 ),
             ],
         },
     ),
     "ms": TuyaBLECategorySelectMapping(
         products={
-            **dict.fromkeys(
-                ["ludzroix", "isk2p555"], # Smart Lock
-                [
+            **{
+                product_id: [
                     TuyaBLESelectMapping(
                         dp_id=31,
                         description=SelectEntityDescription(
@@ -101,7 +105,8 @@ mapping: dict[str, TuyaBLECategorySelectMapping] = {
                         ),
                     ),
                 ]
-            ),
+                for product_id in ["ludzroix", "isk2p555"] # Smart Lock
+            },
         }
     ),
     "jtmspro": TuyaBLECategorySelectMapping(
@@ -140,45 +145,45 @@ mapping: dict[str, TuyaBLECategorySelectMapping] = {
     ),
     "szjqr": TuyaBLECategorySelectMapping(
         products={
-            **dict.fromkeys(
-                ["3yqdo5yt", "xhf790if"],  # CubeTouch 1s and II
-                [
+            **{
+                product_id: [
                     TuyaBLEFingerbotModeMapping(dp_id=2),
-                ],
-            ),
-            **dict.fromkeys(
-                [
+                ]
+                for product_id in ["3yqdo5yt", "xhf790if"]  # CubeTouch 1s and II
+            },
+            **{
+                product_id: [
+                    TuyaBLEFingerbotModeMapping(dp_id=8),
+                ]
+                for product_id in [
                     "blliqpsj",
                     "ndvkgsrm",
                     "yiihr7zh",
                     "riecov42",
                     "neq16kgd"
-                ],  # Fingerbot Plus
-                [
+                ]  # Fingerbot Plus
+            },
+            **{
+                product_id: [
                     TuyaBLEFingerbotModeMapping(dp_id=8),
-                ],
-            ),
-            **dict.fromkeys(
-                ["ltak7e1p", "y6kttvd6", "yrnk7mnn",
+                ]
+                for product_id in ["ltak7e1p", "y6kttvd6", "yrnk7mnn",
                     "nvr2rocq", "bnt7wajf", "rvdceqjh",
-                    "5xhbk964"],  # Fingerbot
-                [
-                    TuyaBLEFingerbotModeMapping(dp_id=8),
-                ],
-            ),
+                    "5xhbk964"]  # Fingerbot
+            },
         },
     ),
     "kg": TuyaBLECategorySelectMapping(
         products={
-            **dict.fromkeys(
-                [
+            **{
+                product_id: [
+                    TuyaBLEFingerbotModeMapping(dp_id=101),
+                ]
+                for product_id in [
                     "mknd4lci",
                     "riecov42"
-                ],  # Fingerbot Plus
-                [
-                    TuyaBLEFingerbotModeMapping(dp_id=101),
-                ],
-            ),
+                ]  # Fingerbot Plus
+            },
         },
     ),
     "wsdcg": TuyaBLECategorySelectMapping(
@@ -188,10 +193,6 @@ mapping: dict[str, TuyaBLECategorySelectMapping] = {
                 TuyaBLESelectMapping(
                     dp_id=9,
                     description=TemperatureUnitDescription(
-                        options=[
-                            UnitOfTemperature.CELSIUS,
-                            UnitOfTemperature.FAHRENHEIT,
-                        ],
                         entity_registry_enabled_default=False,
                     )
                 ),
@@ -204,39 +205,7 @@ mapping: dict[str, TuyaBLECategorySelectMapping] = {
             [
                 TuyaBLESelectMapping(
                     dp_id=106,
-                    description=TemperatureUnitDescription(
-                        options=[
-                            UnitOfTemperature.CELSIUS,
-                            UnitOfTemperature.FAHRENHEIT,
-                        ],
-                    )
-                ),
-                TuyaBLESelectMapping(
-                    dp_id=107,
-                    description=SelectEntityDescription(
-                        key="reminder_mode",
-                        options=[
-                            "interval_reminder",
-                            "schedule_reminder",
-                        ],
-                        entity_category=EntityCategory.CONFIG,
-                    ),
-                ),
-            ],
-        },
-    ),
-    "znhsb": TuyaBLECategorySelectMapping(
-        products={
-            "cdlandip":  # Smart water bottle
-            [
-                TuyaBLESelectMapping(
-                    dp_id=106,
-                    description=TemperatureUnitDescription(
-                        options=[
-                            UnitOfTemperature.CELSIUS,
-                            UnitOfTemperature.FAHRENHEIT,
-                        ],
-                    )
+                    description=_TEMPERATURE_UNIT_DESCRIPTION,
                 ),
                 TuyaBLESelectMapping(
                     dp_id=107,
@@ -284,23 +253,27 @@ mapping: dict[str, TuyaBLECategorySelectMapping] = {
             ],
         }
     ),
-}
+})
+
+
+# Flattened lookup table, (category, None) holds the category wide mappings
+_FLAT: dict[tuple[str, str | None], list[TuyaBLESelectMapping]] = {}
+for category_id, category_mapping in mapping.items():
+    if category_mapping.products:
+        for product_id, product_mapping in category_mapping.products.items():
+            _FLAT[(category_id, product_id)] = product_mapping
+    if category_mapping.mapping:
+        _FLAT[(category_id, None)] = category_mapping.mapping
 
 
 def get_mapping_by_device(
     device: TuyaBLEDevice
-) -> list[TuyaBLECategorySelectMapping]:
-    category = mapping.get(device.category)
-    if category is not None and category.products is not None:
-        product_mapping = category.products.get(device.product_id)
-        if product_mapping is not None:
-            return product_mapping
-        if category.mapping is not None:
-            return category.mapping
-        else:
-            return []
-    else:
-        return []
+) -> list[TuyaBLESelectMapping]:
+    return (
+        _FLAT.get((device.category, device.product_id)) or
+        _FLAT.get((device.category, None)) or
+        []
+    )
 
 
 class TuyaBLESelect(TuyaBLEEntity, SelectEntity):
@@ -314,27 +287,30 @@ class TuyaBLESelect(TuyaBLEEntity, SelectEntity):
         product: TuyaBLEProductInfo,
         mapping: TuyaBLESelectMapping,
     ) -> None:
-        _LOGGER.debug(
-            "Initializing TuyaBLESelect with device: %s, product: %s, mapping: %s",
-            device, product, mapping
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Initializing TuyaBLESelect with device: %s, product: %s, mapping: %s",
+                device, product, mapping
+            )
         super().__init__(hass, coordinator, device, product, mapping.description)
         self._mapping = mapping
-        _LOGGER.debug("TuyaBLESelect initialized with mapping: %s", self._mapping)
 
     @property
     def current_option(self) -> str | None:
         """Return the current selected option."""
-        _LOGGER.debug("Getting current option for device: %s", self._device)
         datapoint = self._device.datapoints[self._mapping.dp_id]
         if datapoint:
-            current_option = datapoint.value
-            _LOGGER.debug("Current option obtained from datapoint: %s", current_option)
-            return current_option
-        _LOGGER.debug("No datapoint found, returning None")
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "%s: Current option of DP %s: %s",
+                    self._device.address,
+                    self._mapping.dp_id,
+                    datapoint.value,
+                )
+            return datapoint.value
         return None
 
-    def select_option(self, option: str) -> None:
+    async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
         _LOGGER.debug("Selecting option for device: %s to %s", self._device, option)
         datapoint = self._device.datapoints.get_or_create(
@@ -344,13 +320,14 @@ class TuyaBLESelect(TuyaBLEEntity, SelectEntity):
         )
         if datapoint:
             _LOGGER.debug("Setting datapoint value to: %s", option)
-            self._hass.create_task(datapoint.set_value(option))
+            await datapoint.set_value(option)
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
         result = super().available
-        _LOGGER.debug("Checking availability for device: %s, result: %s", self._device, result)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("%s: Select available: %s", self._device.address, result)
         return result
 
 
@@ -363,21 +340,20 @@ async def async_setup_entry(
     _LOGGER.debug("Setting up Tuya BLE selects for entry: %s", entry.entry_id)
     data: TuyaBLEData = hass.data[DOMAIN][entry.entry_id]
     mappings = get_mapping_by_device(data.device)
-    _LOGGER.debug("Mappings obtained for device: %s", mappings)
-    entities: list[TuyaBLESelect] = []
-    for mapping in mappings:
-        if mapping.force_add or data.device.datapoints.has_id(
-            mapping.dp_id, mapping.dp_type
-        ):
-            _LOGGER.debug("Adding TuyaBLESelect entity for mapping: %s", mapping)
-            entities.append(
-                TuyaBLESelect(
-                    hass,
-                    data.coordinator,
-                    data.device,
-                    data.product,
-                    mapping,
-                )
-            )
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug("Mappings obtained for device: %s", mappings)
+    has_id = data.device.datapoints.has_id
+    entities: list[TuyaBLESelect] = [
+        TuyaBLESelect(
+            hass,
+            data.coordinator,
+            data.device,
+            data.product,
+            mapping,
+        )
+        for mapping in mappings
+        if mapping.force_add or has_id(mapping.dp_id, mapping.dp_type)
+    ]
     async_add_entities(entities)
-    _LOGGER.debug("Entities added: %s", entities)
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug("Entities added: %s", entities)
@@ -2,8 +2,6 @@ import asyncio
 import logging
 from tuya_iot import TuyaOpenAPI, AuthType
 
-# Set up logging
-logging.basicConfig(level=logging.DEBUG)
 LOGGER = logging.getLogger(__name__)
 
 # Your configuration
@@ -37,8 +35,7 @@ async def test_tuya_auth():
         LOGGER.info("Attempting to connect...")
         
         # Connect
-        response = await asyncio.get_event_loop().run_in_executor(
-            None,
+        response = await asyncio.to_thread(
             api.connect,
             CLOUD_CONFIG['username'],
             CLOUD_CONFIG['password'],
@@ -64,6 +61,7 @@ async def test_tuya_auth():
 
 def main():
     """Main function to run the test."""
+    logging.basicConfig(level=logging.DEBUG)
     LOGGER.info("Starting Tuya authentication test")
     asyncio.run(test_tuya_auth())
 
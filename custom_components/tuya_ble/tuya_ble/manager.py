@@ -1,12 +1,25 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections import namedtuple
 from dataclasses import dataclass
 import logging
+import reprlib
+import time
 
 _LOGGER = logging.getLogger(__name__)
 
-@dataclass
+# Lifetime of the cached credentials and how long before expiry they are refreshed
+CREDENTIALS_CACHE_TTL = 600
+CREDENTIALS_CACHE_EARLY_REFRESH = 30
+
+_CredCacheEntry = namedtuple("_CredCacheEntry", "creds expires_at")
+
+# Keeps long functions/status_range lists from flooding the logs
+_short_repr = reprlib.Repr()
+_short_repr.maxlist = _short_repr.maxtuple = 6
+
+@dataclass(slots=True)
 class TuyaBLEDeviceCredentials:
     uuid: str
     local_key: str
@@ -24,26 +37,56 @@ class TuyaBLEDeviceCredentials:
             "uuid: xxxxxxxxxxxxxxxx, "
             "local_key: xxxxxxxxxxxxxxxx, "
             "device_id: xxxxxxxxxxxxxxxx, "
-            "category: %s, "
-            "product_id: %s, "
-            "device_name: %s, "
-            "product_model: %s, "
-            "product_name: %s, "
-            "functions: %s, "
-            "status_range: %s"
-        ) % (
-            self.category,
-            self.product_id,
-            self.device_name,
-            self.product_model,
-            self.product_name,
-            self.functions,
-            self.status_range,
+            f"category: {self.category}, "
+            f"product_id: {self.product_id}, "
+            f"device_name: {self.device_name}, "
+            f"product_model: {self.product_model}, "
+            f"product_name: {self.product_name}, "
+            f"functions: {_short_repr.repr(self.functions)}, "
+            f"status_range: {_short_repr.repr(self.status_range)}"
         )
 
 class AbstractTuyaBLEDeviceManager(ABC):
     """Abstract manager of the Tuya BLE devices credentials."""
 
+    def __init__(
+        self,
+        cred_cache: dict[tuple[str, str], _CredCacheEntry] | None = None,
+    ) -> None:
+        # Keyed by (account id, device address)
+        self._cred_cache: dict[tuple[str, str], _CredCacheEntry] = (
+            {} if cred_cache is None else cred_cache
+        )
+
+    def _credentials_cache_account(self) -> str:
+        """Account the cached credentials belong to."""
+        return ""
+
+    async def get_device_credentials_cached(
+        self,
+        address: str,
+    ) -> TuyaBLEDeviceCredentials | None:
+        """Get credentials of the Tuya BLE device, looking them up again on expiry."""
+        account = self._credentials_cache_account()
+        if not account:
+            # Nothing to scope the entry by, it could not be invalidated
+            return await self.get_device_credentials(address)
+        key = (account, address)
+        entry = self._cred_cache.get(key)
+        now = time.monotonic()
+        if (
+            entry is not None and
+            now < entry.expires_at - CREDENTIALS_CACHE_EARLY_REFRESH
+        ):
+            return entry.creds
+
+        credentials = await self.get_device_credentials(address)
+        if credentials is not None:
+            self._cred_cache[key] = _CredCacheEntry(
+                credentials, now + CREDENTIALS_CACHE_TTL
+            )
+        return credentials
+
     @abstractmethod
     async def get_device_credentials(
         self,
@@ -277,6 +277,8 @@ class TuyaBLEDevice:
         self._login_key: bytes | None = None
         self._session_key: bytes | None = None
         self._is_paired = False
+        self._connected_event = asyncio.Event()
+        self._is_registered = False
         self._input_buffer: bytearray | None = None
         self._input_expected_packet_num = 0
         self._input_expected_length = 0
@@ -559,6 +561,24 @@ class TuyaBLEDevice:
         for callback in self._disconnected_callbacks:
             callback()
 
+    @property
+    def connected_event(self) -> asyncio.Event:
+        """Event set while the device is connected and paired."""
+        return self._connected_event
+
+    @property
+    def is_registered(self) -> bool:
+        """True once the device has been connected and paired."""
+        return self._is_registered
+
+    async def async_register(self, timeout: float = 30) -> None:
+        """Wait for the device to connect and pair, shared by all entities."""
+        if self._is_registered:
+            return
+        # Every caller waits on the same event, so timeouts run concurrently
+        await asyncio.wait_for(self._connected_event.wait(), timeout)
+        self._is_registered = True
+
     def register_disconnected_callback(
         self, callback: Callable[[], None]
     ) -> Callable[[], None]:
@@ -584,6 +604,7 @@ class TuyaBLEDevice:
         """Disconnected callback."""
         was_paired = self._is_paired
         self._is_paired = False
+        self._connected_event.clear()
         self._fire_disconnected_callbacks()
         if self._expected_disconnect:
             _LOGGER.debug(
@@ -1181,6 +1202,10 @@ class TuyaBLEDevice:
                     )
                     result = 0
                 self._is_paired = result == 0
+                if self._is_paired:
+                    self._connected_event.set()
+                else:
+                    self._connected_event.clear()
 
             case TuyaBLECode.FUN_SENDER_DEVICE_STATUS:
                 if len(data) != 1:
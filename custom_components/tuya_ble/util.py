@@ -1,8 +1,6 @@
 """Utility methods for the Tuya integration."""
 from __future__ import annotations
-import logging
 
-_LOGGER = logging.getLogger(__name__)
 
 def remap_value(
     value: float | int,
@@ -13,13 +11,11 @@ def remap_value(
     reverse: bool = False,
 ) -> float:
     """Remap a value from its current range, to a new range."""
-    _LOGGER.debug(
-        "Remapping value: %s from range (%s, %s) to range (%s, %s), reverse: %s",
-        value, from_min, from_max, to_min, to_max, reverse
-    )
     if reverse:
         value = from_max - value + from_min
-        _LOGGER.debug("Value reversed to: %s", value)
-    remapped_value = ((value - from_min) / (from_max - from_min)) * (to_max - to_min) + to_min
-    _LOGGER.debug("Remapped value: %s", remapped_value)
-    return remapped_value
+    if from_min == to_min and from_max == to_max:
+        return float(value)
+    from_span = from_max - from_min
+    if from_span == 0:
+        raise ValueError(f"Cannot remap from the empty range ({from_min}, {from_max})")
+    return ((value - from_min) / from_span) * (to_max - to_min) + to_min